@@ -1,12 +1,21 @@
+import json
 import requests
+from collections import OrderedDict
+from itertools import islice, zip_longest
 from typing import Dict, Any, List
 from core.base_connector import BaseConnector
 import logging
+import sys
+import threading
 import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on datasets whose variable definitions are kept per connector;
+# each entry is a full variables.json document, often several MB
+VARIABLES_CACHE_SIZE = 4
+
 class CensusConnector(BaseConnector):
     """
     Connector for Census.gov API.
@@ -20,6 +29,11 @@ class CensusConnector(BaseConnector):
         self.api_key = config.get("api_key")  # Optional but recommended
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 1)
+        # Raw variables.json bodies keyed by dataset, least recently used first
+        self._variables_cache = OrderedDict()
+        # Connectors are shared across request threads, so cache lookups
+        # and evictions happen under this lock
+        self._variables_lock = threading.Lock()
     
     def connect(self) -> bool:
         """Establish connection by validating API access."""
@@ -139,16 +153,22 @@ class CensusConnector(BaseConnector):
                 "schema": {"fields": []}
             }
         
-        # First row contains headers
-        headers = data[0]
+        # First row contains headers; intern them so every record shares
+        # the same key objects
+        headers = [
+            sys.intern(header) if isinstance(header, str) else header
+            for header in data[0]
+        ]
         
-        # Convert remaining rows to dictionaries
-        records = []
-        for row in data[1:]:
-            record = {}
-            for i, header in enumerate(headers):
-                record[header] = row[i] if i < len(row) else None
-            records.append(record)
+        # Convert remaining rows to dictionaries. Rows are normally the
+        # same width as the header; short rows are padded with None and
+        # extra trailing cells are ignored
+        width = len(headers)
+        records = [
+            dict(zip(headers, row)) if len(row) == width
+            else dict(zip_longest(headers, islice(row, width)))
+            for row in data[1:]
+        ]
         
         # Create standardized response
         standardized = {
@@ -171,13 +191,8 @@ class CensusConnector(BaseConnector):
         Returns:
             List of field definitions
         """
-        fields = []
-        for header in headers:
-            fields.append({
-                "name": header,
-                "type": "string"  # Census API returns all as strings
-            })
-        return fields
+        # Census API returns all values as strings
+        return [{"name": header, "type": "string"} for header in headers]
     
     def get_capabilities(self) -> Dict[str, Any]:
         """Get connector capabilities."""
@@ -212,17 +227,32 @@ class CensusConnector(BaseConnector):
         """
         Get available variables for a dataset.
         
+        Successful responses are cached per dataset as raw JSON bytes and
+        decoded on every call, so each caller gets its own copy.
+        
         Args:
             dataset: Dataset identifier
             
         Returns:
             Dict of variable definitions
         """
+        with self._variables_lock:
+            content = self._variables_cache.get(dataset)
+            if content is not None:
+                self._variables_cache.move_to_end(dataset)
+        if content is not None:
+            return json.loads(content)
+        
         try:
             variables_url = f"{self.base_url}/{dataset}/variables.json"
             response = requests.get(variables_url, timeout=10)
             if response.status_code == 200:
-                return response.json()
+                variables = json.loads(response.content)
+                with self._variables_lock:
+                    self._variables_cache[dataset] = response.content
+                    if len(self._variables_cache) > VARIABLES_CACHE_SIZE:
+                        self._variables_cache.popitem(last=False)
+                return variables
         except Exception as e:
             logger.error(f"Failed to retrieve variables: {str(e)}")
         
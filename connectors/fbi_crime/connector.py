@@ -15,6 +15,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Query parameters that are encoded in the URL path or set by the connector
+RESERVED_PARAMETERS = frozenset({'endpoint', 'from', 'to', 'api_key'})
+
 
 class FBICrimeConnector(BaseConnector):
     """
@@ -37,6 +40,7 @@ class FBICrimeConnector(BaseConnector):
                 - url: Base API URL
                 - api_key: FBI Crime Data API key
                 - format: Response format (default: JSON)
+                - max_retry_seconds: Total time budget for retry waits (default: 30)
         """
         super().__init__(config)
         self.base_url = config.get('url', 'https://api.usa.gov/crime/fbi/sapi')
@@ -45,6 +49,7 @@ class FBICrimeConnector(BaseConnector):
         self.session = None
         self.max_retries = config.get('max_retries', 3)
         self.retry_delay = config.get('retry_delay', 1)
+        self.max_retry_seconds = config.get('max_retry_seconds', 30)
         
     def connect(self) -> bool:
         """
@@ -54,7 +59,7 @@ class FBICrimeConnector(BaseConnector):
             bool: True if connection successful
         """
         try:
-            self.session = requests.Session()
+            self.session = self._create_session(pool_connections=16, pool_maxsize=64)
             self.session.headers.update({
                 'Accept': 'application/json'
             })
@@ -125,19 +130,18 @@ class FBICrimeConnector(BaseConnector):
             else:
                 url = f"{self.base_url}/api/{endpoint}/{from_year}/{to_year}"
             
-            # Build query parameters
+            # Build query parameters (endpoint, from, to are in the URL)
             params = {'api_key': self.api_key}
-            
-            # Add other parameters (excluding endpoint, from, to which are in URL)
-            for key, value in parameters.items():
-                if key not in ['endpoint', 'from', 'to', 'api_key']:
-                    params[key] = value
+            params.update(
+                (key, value) for key, value in parameters.items()
+                if key not in RESERVED_PARAMETERS
+            )
             
             # Execute request with retry logic
             response = self._execute_with_retry(url, params)
             
             # Parse response
-            data = response.json()
+            data = self._parse_json_response(response)
             
             # Transform to standard format
             transformed_data = self.transform(data)
@@ -163,6 +167,9 @@ class FBICrimeConnector(BaseConnector):
         """
         Execute request with exponential backoff retry logic.
         
+        Waits between attempts, including server Retry-After hints, are
+        capped so their total stays within max_retry_seconds.
+        
         Args:
             url: Request URL
             params: Query parameters
@@ -171,30 +178,45 @@ class FBICrimeConnector(BaseConnector):
             requests.Response: HTTP response
         """
         last_exception = None
+        waited = 0.0
         
         for attempt in range(self.max_retries):
+            can_retry = attempt < self.max_retries - 1
             try:
                 response = self.session.get(url, params=params, timeout=30)
                 
-                # Check for rate limiting
+                # Check for rate limiting; once retries or the wait budget
+                # run out the 429 is raised below like any other HTTP error
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', self.retry_delay))
-                    logger.warning(f"Rate limited. Retrying after {retry_after} seconds...")
-                    time.sleep(retry_after)
-                    continue
+                    remaining = self.max_retry_seconds - waited
+                    if can_retry and remaining > 0:
+                        # Retry-After is whole seconds or an HTTP-date; anything
+                        # but an integer falls back to the configured delay
+                        try:
+                            retry_after = int(response.headers['Retry-After'])
+                        except (KeyError, ValueError):
+                            retry_after = self.retry_delay
+                        wait_time = min(max(retry_after, 0), remaining)
+                        logger.warning(f"Rate limited. Retrying after {wait_time:.1f} seconds...")
+                        time.sleep(wait_time)
+                        waited += wait_time
+                        continue
                 
                 response.raise_for_status()
                 return response
                 
             except requests.exceptions.RequestException as e:
                 last_exception = e
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2 ** attempt)
+                remaining = self.max_retry_seconds - waited
+                if can_retry and remaining > 0:
+                    wait_time = min(self.retry_delay * (2 ** attempt), remaining)
                     logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}). "
-                                 f"Retrying in {wait_time} seconds...")
+                                 f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
+                    waited += wait_time
                 else:
-                    logger.error(f"Request failed after {self.max_retries} attempts")
+                    logger.error(f"Request failed after {attempt + 1} attempts")
+                    break
         
         raise last_exception
     
@@ -1,5 +1,6 @@
 import pandas as pd
 import json
+import operator
 import os
 from typing import Dict, Any, List
 from core.base_connector import BaseConnector
@@ -8,6 +9,16 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Comparison operators supported in dict-style filters, e.g. {"$gt": 100}
+FILTER_OPERATORS = {
+    "$gt": operator.gt,
+    "$lt": operator.lt,
+    "$gte": operator.ge,
+    "$lte": operator.le,
+    "$eq": operator.eq,
+    "$ne": operator.ne,
+}
+
 class LocalFileConnector(BaseConnector):
     """
     Connector for local file-based data sources.
@@ -119,27 +130,29 @@ class LocalFileConnector(BaseConnector):
             if available_cols:
                 df = df[available_cols]
         
-        # Apply filters
+        # Apply filters as one combined boolean mask
         filters = parameters.get("filters", {})
+        mask = None
         for column, value in filters.items():
-            if column in df.columns:
-                if isinstance(value, dict):
-                    # Support for operators like {"$gt": 100}
-                    if "$gt" in value:
-                        df = df[df[column] > value["$gt"]]
-                    if "$lt" in value:
-                        df = df[df[column] < value["$lt"]]
-                    if "$gte" in value:
-                        df = df[df[column] >= value["$gte"]]
-                    if "$lte" in value:
-                        df = df[df[column] <= value["$lte"]]
-                    if "$eq" in value:
-                        df = df[df[column] == value["$eq"]]
-                    if "$ne" in value:
-                        df = df[df[column] != value["$ne"]]
-                else:
-                    # Simple equality filter
-                    df = df[df[column] == value]
+            if column not in df.columns:
+                continue
+            
+            series = df[column]
+            if isinstance(value, dict):
+                # Support for operators like {"$gt": 100}
+                conditions = [
+                    FILTER_OPERATORS[op](series, operand)
+                    for op, operand in value.items() if op in FILTER_OPERATORS
+                ]
+            else:
+                # Simple equality filter
+                conditions = [series == value]
+            
+            for condition in conditions:
+                mask = condition if mask is None else mask & condition
+        
+        if mask is not None:
+            df = df[mask]
         
         # Apply sorting
         sort_by = parameters.get("sort_by")
@@ -1,5 +1,6 @@
 import requests
 from typing import Dict, Any, List
+from urllib.parse import urlencode
 from core.base_connector import BaseConnector
 import logging
 import time
@@ -24,6 +25,11 @@ class USDANASSConnector(BaseConnector):
         
         if not self.api_key:
             raise ValueError("API key is required for USDA NASS connector")
+        
+        self.session = self._create_session()
+        
+        # key and format are the same on every request, so encode them once
+        self._fixed_query = urlencode({"key": self.api_key, "format": self.format})
     
     def connect(self) -> bool:
         """Establish connection by validating API key."""
@@ -51,7 +57,7 @@ class USDANASSConnector(BaseConnector):
                 "statisticcat_desc": "PRODUCTION"
             }
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api_GET",
                 params=test_params,
                 timeout=10
@@ -82,23 +88,28 @@ class USDANASSConnector(BaseConnector):
             self.connect()
         
         # Add API key and format
-        query_params = {
-            "key": self.api_key,
-            "format": self.format,
-            **parameters
-        }
+        if "key" in parameters or "format" in parameters:
+            # Caller overrides the connector defaults
+            query_string = self._encode_query({
+                "key": self.api_key,
+                "format": self.format,
+                **parameters
+            })
+        else:
+            extra_query = self._encode_query(parameters)
+            query_string = f"{self._fixed_query}&{extra_query}" if extra_query else self._fixed_query
+        
+        query_url = f"{self.base_url}/api_GET"
+        if query_string:
+            query_url = f"{query_url}?{query_string}"
         
         # Execute query with retry logic
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(
-                    f"{self.base_url}/api_GET",
-                    params=query_params,
-                    timeout=30
-                )
+                response = self.session.get(query_url, timeout=30)
                 
                 if response.status_code == 200:
-                    data = response.json() if self.format == "JSON" else response.text
+                    data = self._parse_json_response(response) if self.format == "JSON" else response.text
                     return self.transform(data)
                 elif response.status_code == 429:  # Rate limit
                     wait_time = self.retry_delay * (2 ** attempt)
@@ -122,6 +133,27 @@ class USDANASSConnector(BaseConnector):
         
         raise Exception("Max retries exceeded")
     
+    @staticmethod
+    def _encode_query(parameters: Dict[str, Any]) -> str:
+        """
+        Encode query parameters the way requests encodes params=.
+        
+        None values are dropped, including None items inside lists, and
+        other list values are repeated once per item.
+        
+        Args:
+            parameters: Query parameters
+            
+        Returns:
+            URL-encoded query string
+        """
+        pairs = []
+        for name, values in parameters.items():
+            if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+                values = [values]
+            pairs.extend((name, value) for value in values if value is not None)
+        return urlencode(pairs)
+    
     def transform(self, data: Any) -> Dict[str, Any]:
         """
         Transform USDA NASS data to standardized format.
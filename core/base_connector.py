@@ -1,6 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
+import re
+
+try:
+    import orjson
+except ImportError:  # listed in requirements.txt; response.json() still works without it
+    orjson = None
+
+# A run of 19+ digits may not fit in 64 bits; orjson would return a float
+_WIDE_INTEGER = re.compile(rb"\d{19}")
 
 class BaseConnector(ABC):
     """
@@ -111,3 +122,56 @@ class BaseConnector(ABC):
             "query_parameters": query_params,
             "version": "1.0"
         }
+    
+    def _create_session(self, pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+        """
+        Create an HTTP session that keeps connections alive between requests.
+        
+        Retries are left to the connectors' own retry loops, so the
+        adapter is mounted with max_retries=0.
+        
+        Args:
+            pool_connections: Number of host pools to cache
+            pool_maxsize: Maximum connections kept per host
+            
+        Returns:
+            requests.Session with pooled adapters mounted
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def _parse_json_response(self, response: Any) -> Any:
+        """
+        Decode the JSON body of an HTTP response.
+        
+        Uses orjson for UTF-8 bodies and falls back to response.json()
+        whenever orjson could decode differently: another declared charset,
+        a body orjson rejects (NaN, a BOM), or integers wider than 64 bits,
+        which orjson would turn into floats.
+        
+        Args:
+            response: requests.Response returned by the API
+            
+        Returns:
+            Decoded JSON payload
+        """
+        if orjson is not None and _is_utf8(response.encoding):
+            content = response.content
+            if not _WIDE_INTEGER.search(content):
+                try:
+                    return orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    pass
+        return response.json()
+
+
+def _is_utf8(encoding: Optional[str]) -> bool:
+    """Return True if a response encoding is UTF-8 or left for detection."""
+    return encoding is None or encoding.lower().replace("-", "").replace("_", "") == "utf8"
@@ -1,13 +1,28 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
 import pandas as pd
 import numpy as np
 from scipy import stats
 from sklearn.decomposition import PCA
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.inspection import permutation_importance
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
 from sklearn.model_selection import train_test_split
+from threadpoolctl import threadpool_limits
+
+
+def _as_c_float64(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Return the given columns as a C-contiguous float64 matrix.
+
+    DataFrame.values hands back a transposed view of the column block,
+    which is Fortran-ordered; sklearn would otherwise copy or transpose it
+    inside every fit.
+    """
+    return np.ascontiguousarray(df[columns].to_numpy(dtype=np.float64))
 
 
 class DataAnalysisEngine:
@@ -22,11 +37,10 @@ class DataAnalysisEngine:
         numeric_df = df.select_dtypes(include="number")
         categorical_df = df.select_dtypes(exclude="number")
 
-        describe_all = df.describe(include="all").fillna(value=np.nan)
         stats_payload = {
             "row_count": int(len(df)),
             "column_count": int(df.shape[1]),
-            "numeric_summary": describe_all.select_dtypes(include="number").to_dict(),
+            "numeric_summary": numeric_df.describe().to_dict() if not numeric_df.empty else {},
             "categorical_summary": {
                 col: categorical_df[col].value_counts().head(5).to_dict()
                 for col in categorical_df.columns
@@ -39,9 +53,10 @@ class DataAnalysisEngine:
 
     def exploratory_analysis(self, df: pd.DataFrame) -> Dict[str, Any]:
         sample_records = df.head(5).to_dict(orient="records")
+        text_df = df.select_dtypes(include=["object", "string"])
         distribution = {
-            col: df[col].value_counts().head(5).to_dict()
-            for col in df.columns if df[col].dtype == "object"
+            col: text_df[col].value_counts().head(5).to_dict()
+            for col in text_df.columns
         }
         return {
             "data_types": df.dtypes.astype(str).to_dict(),
@@ -108,16 +123,23 @@ class DataAnalysisEngine:
         if ts_df.empty:
             raise ValueError("No data available for time series analysis")
 
-        ts_df[time_column] = pd.to_datetime(ts_df[time_column])
-        ts_df = ts_df.sort_values(time_column).set_index(time_column)
-        series = ts_df[target_column].astype(float)
+        # Build the series straight from the two columns instead of
+        # assigning back into the frame and re-indexing it
+        times = ts_df[time_column]
+        if not pd.api.types.is_datetime64_any_dtype(times):
+            times = pd.to_datetime(times)
+        series = pd.Series(
+            ts_df[target_column].to_numpy(dtype=np.float64),
+            index=pd.DatetimeIndex(times, name=time_column),
+            name=target_column,
+        ).sort_index()
 
         if freq:
             series = series.resample(freq).mean().interpolate()
 
         rolling = series.rolling(window=rolling_window, min_periods=1).mean()
         pct_change = series.pct_change()
-        slope = float(np.polyfit(range(len(series)), series.values, 1)[0]) if len(series) > 1 else 0.0
+        slope = self._trend_slope(series.to_numpy(dtype=np.float64))
 
         return {
             "recent_values": series.tail(20).to_dict(),
@@ -126,6 +148,17 @@ class DataAnalysisEngine:
             "trend_slope": slope,
         }
 
+    @staticmethod
+    def _trend_slope(values: np.ndarray) -> float:
+        """Least-squares slope of values against their position."""
+        if len(values) < 2:
+            return 0.0
+        x = np.arange(len(values), dtype=np.float64)
+        x_centered = x - x.mean()
+        return float(
+            (x_centered * (values - values.mean())).sum() / (x_centered ** 2).sum()
+        )
+
     def linear_regression(
         self,
         df: pd.DataFrame,
@@ -138,8 +171,8 @@ class DataAnalysisEngine:
         if len(dataset) < 2:
             raise ValueError("Not enough rows for regression analysis")
 
-        X = dataset[features].values
-        y = dataset[target].values
+        X = _as_c_float64(dataset, features)
+        y = dataset[target].to_numpy(dtype=np.float64)
 
         if len(dataset) > 4:
             X_train, X_test, y_train, y_test = train_test_split(
@@ -170,13 +203,14 @@ class DataAnalysisEngine:
         max_depth: Optional[int] = None,
         test_size: float = 0.2,
         random_state: int = 42,
+        n_jobs: Optional[int] = -1,
     ) -> Dict[str, Any]:
         dataset = df[features + [target]].dropna()
         if len(dataset) < 5:
             raise ValueError("Not enough rows for random forest regression")
 
-        X = dataset[features].values
-        y = dataset[target].values
+        X = _as_c_float64(dataset, features)
+        y = dataset[target].to_numpy(dtype=np.float64)
 
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=test_size, random_state=random_state
@@ -186,6 +220,7 @@ class DataAnalysisEngine:
             n_estimators=n_estimators,
             max_depth=max_depth,
             random_state=random_state,
+            n_jobs=n_jobs,
         )
         model.fit(X_train, y_train)
         predictions = model.predict(X_test)
@@ -198,19 +233,72 @@ class DataAnalysisEngine:
             "predictions_sample": predictions[:5].tolist(),
         }
 
+    def hist_gradient_boosting_regression(
+        self,
+        df: pd.DataFrame,
+        features: List[str],
+        target: str,
+        max_iter: int = 100,
+        max_depth: Optional[int] = None,
+        learning_rate: float = 0.1,
+        test_size: float = 0.2,
+        random_state: int = 42,
+        n_jobs: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        dataset = df[features + [target]].dropna()
+        if len(dataset) < 5:
+            raise ValueError("Not enough rows for gradient boosting regression")
+
+        X = _as_c_float64(dataset, features)
+        y = dataset[target].to_numpy(dtype=np.float64)
+
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=test_size, random_state=random_state
+        )
+
+        model = HistGradientBoostingRegressor(
+            max_iter=max_iter,
+            max_depth=max_depth,
+            learning_rate=learning_rate,
+            random_state=random_state,
+        )
+        model.fit(X_train, y_train)
+        predictions = model.predict(X_test)
+
+        # Histogram-based boosting has no impurity importances, so rank
+        # features by how much shuffling each one degrades the held-out score
+        importance = permutation_importance(
+            model, X_test, y_test,
+            n_repeats=5,
+            random_state=random_state,
+            n_jobs=n_jobs,
+        )
+
+        mse = mean_squared_error(y_test, predictions)
+        return {
+            "feature_importance": dict(zip(features, importance.importances_mean.tolist())),
+            "r2_score": float(r2_score(y_test, predictions)),
+            "rmse": float(np.sqrt(mse)),
+            "predictions_sample": predictions[:5].tolist(),
+        }
+
     def multivariate_analysis(
         self,
         df: pd.DataFrame,
         features: List[str],
         n_components: int = 2,
+        svd_solver: str = "auto",
+        random_state: int = 42,
     ) -> Dict[str, Any]:
         dataset = df[features].dropna()
         if dataset.empty:
             raise ValueError("No data available for multivariate analysis")
 
         components = min(n_components, len(features), len(dataset))
-        pca = PCA(n_components=components)
-        transformed = pca.fit_transform(dataset.values)
+        # "auto" switches to randomized SVD on large inputs when few
+        # components are requested; random_state keeps that reproducible
+        pca = PCA(n_components=components, svd_solver=svd_solver, random_state=random_state)
+        transformed = pca.fit_transform(_as_c_float64(dataset, features))
 
         return {
             "explained_variance_ratio": pca.explained_variance_ratio_.tolist(),
@@ -231,15 +319,26 @@ class DataAnalysisEngine:
             result = self.linear_regression(df, features, target, **kwargs)
         elif model_type in {"forest", "random_forest"}:
             result = self.random_forest_regression(df, features, target, **kwargs)
+        elif model_type in {"hist", "hist_gradient_boosting"}:
+            result = self.hist_gradient_boosting_regression(df, features, target, **kwargs)
         else:
             raise ValueError(f"Unsupported predictive model: {model_type}")
 
         result["model_type"] = model_type
         return result
 
-    def run_suite(self, df: pd.DataFrame, plan: Dict[str, Any]) -> Dict[str, Any]:
+    def run_suite(
+        self,
+        df: pd.DataFrame,
+        plan: Dict[str, Any],
+        max_workers: Optional[int] = 1,
+    ) -> Dict[str, Any]:
         """
         Execute a configurable analysis plan against a DataFrame.
+        Stages run one after another by default. They are independent, so
+        max_workers > 1 (or None for one per core) runs them on a thread
+        pool instead, with every native thread pool capped at one thread
+        per stage.
         Example plan:
         {
             "basic_statistics": True,
@@ -252,67 +351,88 @@ class DataAnalysisEngine:
             "predictive": {"features": ["x1", "x2"], "target": "y", "model_type": "forest"}
         }
         """
-        results: Dict[str, Any] = {}
-
-        if plan.get("basic_statistics"):
-            results["basic_statistics"] = self.basic_statistics(df)
-
-        if plan.get("exploratory"):
-            results["exploratory_analysis"] = self.exploratory_analysis(df)
-
-        if plan.get("inferential_tests"):
-            results["inferential_analysis"] = self.inferential_analysis(
-                df, plan["inferential_tests"], plan.get("alpha", 0.05)
-            )
-
-        if plan.get("time_series"):
-            ts_cfg = plan["time_series"]
-            results["time_series_analysis"] = self.time_series_analysis(
-                df,
-                time_column=ts_cfg["time_column"],
-                target_column=ts_cfg["target_column"],
-                freq=ts_cfg.get("freq"),
-                rolling_window=ts_cfg.get("rolling_window", 7),
-            )
-
-        if plan.get("linear_regression"):
-            lr_cfg = plan["linear_regression"]
-            results["linear_regression"] = self.linear_regression(
-                df,
-                features=lr_cfg["features"],
-                target=lr_cfg["target"],
-                test_size=lr_cfg.get("test_size", 0.2),
-                random_state=lr_cfg.get("random_state", 42),
-            )
-
-        if plan.get("random_forest"):
-            rf_cfg = plan["random_forest"]
-            results["random_forest_regression"] = self.random_forest_regression(
-                df,
-                features=rf_cfg["features"],
-                target=rf_cfg["target"],
-                n_estimators=rf_cfg.get("n_estimators", 200),
-                max_depth=rf_cfg.get("max_depth"),
-                test_size=rf_cfg.get("test_size", 0.2),
-                random_state=rf_cfg.get("random_state", 42),
-            )
-
-        if plan.get("multivariate"):
-            mv_cfg = plan["multivariate"]
-            results["multivariate_analysis"] = self.multivariate_analysis(
-                df,
-                features=mv_cfg["features"],
-                n_components=mv_cfg.get("n_components", 2),
-            )
-
-        if plan.get("predictive"):
-            pred_cfg = plan["predictive"]
-            results["predictive_analysis"] = self.predictive_analysis(
-                df,
-                features=pred_cfg["features"],
-                target=pred_cfg["target"],
-                model_type=pred_cfg.get("model_type", "linear"),
-                **{k: v for k, v in pred_cfg.items() if k not in {"features", "target", "model_type"}}
-            )
-
-        return results
+        stages = [
+            ("basic_statistics", "basic_statistics",
+             lambda cfg, n_jobs: self.basic_statistics(df)),
+            ("exploratory", "exploratory_analysis",
+             lambda cfg, n_jobs: self.exploratory_analysis(df)),
+            ("inferential_tests", "inferential_analysis",
+             lambda cfg, n_jobs: self.inferential_analysis(df, cfg, plan.get("alpha", 0.05))),
+            ("time_series", "time_series_analysis",
+             lambda cfg, n_jobs: self.time_series_analysis(
+                 df,
+                 time_column=cfg["time_column"],
+                 target_column=cfg["target_column"],
+                 freq=cfg.get("freq"),
+                 rolling_window=cfg.get("rolling_window", 7),
+             )),
+            ("linear_regression", "linear_regression",
+             lambda cfg, n_jobs: self.linear_regression(
+                 df,
+                 features=cfg["features"],
+                 target=cfg["target"],
+                 test_size=cfg.get("test_size", 0.2),
+                 random_state=cfg.get("random_state", 42),
+             )),
+            ("random_forest", "random_forest_regression",
+             lambda cfg, n_jobs: self.random_forest_regression(
+                 df,
+                 features=cfg["features"],
+                 target=cfg["target"],
+                 n_estimators=cfg.get("n_estimators", 200),
+                 max_depth=cfg.get("max_depth"),
+                 test_size=cfg.get("test_size", 0.2),
+                 random_state=cfg.get("random_state", 42),
+                 n_jobs=cfg.get("n_jobs", n_jobs),
+             )),
+            ("multivariate", "multivariate_analysis",
+             lambda cfg, n_jobs: self.multivariate_analysis(
+                 df,
+                 features=cfg["features"],
+                 n_components=cfg.get("n_components", 2),
+                 svd_solver=cfg.get("svd_solver", "auto"),
+                 random_state=cfg.get("random_state", 42),
+             )),
+            ("predictive", "predictive_analysis",
+             lambda cfg, n_jobs: self.predictive_analysis(
+                 df,
+                 features=cfg["features"],
+                 target=cfg["target"],
+                 model_type=cfg.get("model_type", "linear"),
+                 **self._predictive_options(cfg, n_jobs)
+             )),
+        ]
+
+        selected = [
+            (result_key, runner, plan[plan_key])
+            for plan_key, result_key, runner in stages
+            if plan.get(plan_key)
+        ]
+        workers = min(len(selected), max_workers or os.cpu_count() or 1)
+
+        if workers <= 1:
+            return {key: runner(cfg, -1) for key, runner, cfg in selected}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (key, pool.submit(self._run_single_threaded, runner, cfg))
+                for key, runner, cfg in selected
+            ]
+            return {key: future.result() for key, future in futures}
+
+    @staticmethod
+    def _run_single_threaded(runner, cfg: Dict[str, Any]) -> Dict[str, Any]:
+        # Stages already share the pool, so keep each one to a single core:
+        # n_jobs=1 covers joblib, threadpool_limits covers the OpenMP threads
+        # of HistGradientBoostingRegressor and BLAS
+        with threadpool_limits(limits=1):
+            return runner(cfg, 1)
+
+    @staticmethod
+    def _predictive_options(cfg: Dict[str, Any], n_jobs: int) -> Dict[str, Any]:
+        options = {k: v for k, v in cfg.items() if k not in {"features", "target", "model_type"}}
+        # Only forests get the suite's n_jobs; for hist it would start a
+        # process pool for permutation importance, so that stays opt-in
+        if cfg.get("model_type", "linear").lower() in {"forest", "random_forest"}:
+            options.setdefault("n_jobs", n_jobs)
+        return options
@@ -22,6 +22,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from core.query_engine import QueryEngine
 from models.connector_config import ConnectorConfig
+import functools
 import json
 from datetime import datetime
 import logging
@@ -181,6 +182,17 @@ def check_connector_status():
         return False, f"Error checking connector: {str(e)}"
 
 
+@functools.lru_cache(maxsize=1)
+def get_query_engine():
+    """
+    Get the query engine shared by all queries in this process.
+    
+    Returns:
+        QueryEngine: Lazily created engine instance
+    """
+    return QueryEngine()
+
+
 def execute_query(parameters, use_cache=True, show_details=True):
     """
     Execute a query against FBI Crime Data Explorer API.
@@ -193,7 +205,7 @@ def execute_query(parameters, use_cache=True, show_details=True):
     Returns:
         dict: Query results
     """
-    query_engine = QueryEngine()
+    query_engine = get_query_engine()
     
     if show_details:
         print("\n" + "="*70)
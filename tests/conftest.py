@@ -0,0 +1,26 @@
+import json
+
+import pytest
+import requests
+
+
+def build_response(status_code=200, payload=None, headers=None, content=None):
+    """
+    Build a requests.Response without touching the network.
+    
+    payload is JSON-encoded into the body unless raw content is given.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json"
+    response.headers.update(headers or {})
+    if content is None:
+        content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    response._content = content
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+@pytest.fixture
+def make_response():
+    return build_response
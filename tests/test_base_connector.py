@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+import core.base_connector as base_module
+from connectors.census.connector import CensusConnector
+
+
+@pytest.fixture
+def connector():
+    return CensusConnector({})
+
+
+@pytest.fixture
+def orjson_calls(monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    calls = []
+    loads = orjson.loads
+
+    def recording_loads(content):
+        calls.append(content)
+        return loads(content)
+
+    monkeypatch.setattr(base_module.orjson, "loads", recording_loads)
+    return calls
+
+
+def test_parse_json_response_uses_orjson_for_utf8_bodies(connector, orjson_calls, make_response):
+    response = make_response(content='{"name": "Zoë", "count": 3}'.encode("utf-8"))
+
+    assert connector._parse_json_response(response) == {"name": "Zoë", "count": 3}
+    assert orjson_calls == [response.content]
+
+
+@pytest.mark.parametrize("content, content_type", [
+    # BOM, accepted when requests detects the encoding itself
+    (b'\xef\xbb\xbf{"value": 1}', "application/octet-stream"),
+    # Declared non-UTF-8 charset
+    ('{"value": "Zo\u00eb"}'.encode("latin-1"), "application/json; charset=iso-8859-1"),
+    # Integer wider than 64 bits
+    (b'{"value": 123456789012345678901234567890}', "application/json"),
+])
+def test_parse_json_response_matches_response_json(connector, orjson_calls, make_response, content, content_type):
+    headers = {"Content-Type": content_type}
+    result = connector._parse_json_response(make_response(content=content, headers=headers))
+    expected = make_response(content=content, headers=headers).json()
+
+    assert result == expected
+    assert type(result["value"]) is type(expected["value"])
+
+
+def test_parse_json_response_falls_back_when_orjson_rejects_body(connector, orjson_calls, make_response):
+    result = connector._parse_json_response(make_response(content=b'{"value": NaN}'))
+
+    assert math.isnan(result["value"])
+    assert orjson_calls == [b'{"value": NaN}']
+
+
+def test_parse_json_response_without_orjson(connector, monkeypatch, make_response):
+    monkeypatch.setattr(base_module, "orjson", None)
+    response = make_response(payload={"value": 1})
+
+    assert connector._parse_json_response(response) == {"value": 1}
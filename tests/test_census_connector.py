@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import connectors.census.connector as census_module
+from connectors.census.connector import CensusConnector
+
+
+@pytest.fixture
+def variables_requests(monkeypatch, make_response):
+    calls = []
+
+    def fake_get(url, timeout=None):
+        calls.append(url)
+        dataset = url.split("/data/", 1)[1].rsplit("/variables.json", 1)[0]
+        if dataset == "missing":
+            return make_response(404)
+        if dataset == "broken":
+            raise ConnectionError("connection reset")
+        return make_response(payload={"variables": {"NAME": {"label": dataset}}})
+
+    monkeypatch.setattr(census_module.requests, "get", fake_get)
+    return calls
+
+
+def test_get_dataset_variables_caches_successful_lookups(variables_requests):
+    connector = CensusConnector({})
+
+    first = connector.get_dataset_variables("2020/acs/acs5")
+    second = connector.get_dataset_variables("2020/acs/acs5")
+
+    assert first == second == {"variables": {"NAME": {"label": "2020/acs/acs5"}}}
+    assert len(variables_requests) == 1
+
+
+def test_get_dataset_variables_returns_independent_copies(variables_requests):
+    connector = CensusConnector({})
+
+    result = connector.get_dataset_variables("2020/acs/acs5")
+    result["variables"]["NAME"]["label"] = "changed"
+
+    assert connector.get_dataset_variables("2020/acs/acs5")["variables"]["NAME"]["label"] == "2020/acs/acs5"
+
+
+def test_get_dataset_variables_evicts_least_recently_used(variables_requests):
+    connector = CensusConnector({})
+    datasets = [f"dataset{i}" for i in range(census_module.VARIABLES_CACHE_SIZE)]
+    for dataset in datasets:
+        connector.get_dataset_variables(dataset)
+
+    # Touch the oldest entry so the second one becomes the eviction candidate
+    connector.get_dataset_variables(datasets[0])
+    connector.get_dataset_variables("extra")
+
+    assert list(connector._variables_cache) == datasets[2:] + [datasets[0], "extra"]
+
+    connector.get_dataset_variables(datasets[1])
+    assert variables_requests.count(f"{connector.base_url}/{datasets[1]}/variables.json") == 2
+
+
+def test_get_dataset_variables_does_not_cache_failures(variables_requests):
+    connector = CensusConnector({})
+
+    assert connector.get_dataset_variables("missing") == {}
+    assert connector.get_dataset_variables("missing") == {}
+    assert connector.get_dataset_variables("broken") == {}
+    assert len(variables_requests) == 3
+    assert not connector._variables_cache
+
+
+def test_get_dataset_variables_is_safe_across_threads(variables_requests):
+    connector = CensusConnector({})
+    datasets = [f"dataset{i}" for i in range(census_module.VARIABLES_CACHE_SIZE * 2)]
+
+    def lookup_all():
+        for _ in range(50):
+            for dataset in datasets:
+                assert connector.get_dataset_variables(dataset)["variables"]["NAME"]["label"] == dataset
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(lookup_all) for _ in range(8)]:
+            future.result()
+
+    assert len(connector._variables_cache) == census_module.VARIABLES_CACHE_SIZE
+
+
+def test_transform_aligns_rows_with_headers():
+    connector = CensusConnector({})
+    data = [
+        ["NAME", "B01001_001E", "state"],
+        ["Alabama", "5024279", "01"],
+        ["Alaska", "733391"],
+        ["Arizona", "7151502", "04", "extra"],
+    ]
+
+    result = connector.transform(data)
+
+    assert result["data"] == [
+        {"NAME": "Alabama", "B01001_001E": "5024279", "state": "01"},
+        {"NAME": "Alaska", "B01001_001E": "733391", "state": None},
+        {"NAME": "Arizona", "B01001_001E": "7151502", "state": "04"},
+    ]
+    assert result["metadata"]["record_count"] == 3
+    assert [field["name"] for field in result["schema"]["fields"]] == data[0]
@@ -1,10 +1,11 @@
 import pandas as pd
 import pytest
+from threadpoolctl import threadpool_info
 
 from core.data_analysis import DataAnalysisEngine
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_df():
     return pd.DataFrame(
         {
@@ -102,3 +103,58 @@ def test_run_suite(sample_df):
 
     assert "basic_statistics" in results
     assert "linear_regression" in results
+
+
+def test_predictive_hist_gradient_boosting(sample_df):
+    engine = DataAnalysisEngine()
+
+    predictive = engine.predictive_analysis(
+        sample_df,
+        features=["harvest", "population"],
+        target="value",
+        model_type="hist",
+        max_iter=20,
+    )
+    assert predictive["model_type"] == "hist"
+    assert set(predictive["feature_importance"]) == {"harvest", "population"}
+
+
+def test_run_suite_sequential_matches_parallel(sample_df):
+    engine = DataAnalysisEngine()
+    plan = {
+        "basic_statistics": True,
+        "linear_regression": {"features": ["harvest"], "target": "value"},
+        "random_forest": {"features": ["harvest"], "target": "value", "n_estimators": 10},
+    }
+
+    parallel = engine.run_suite(sample_df, plan, max_workers=3)
+    sequential = engine.run_suite(sample_df, plan)
+
+    assert list(parallel) == list(sequential)
+    assert parallel["linear_regression"] == sequential["linear_regression"]
+    assert parallel["random_forest_regression"] == sequential["random_forest_regression"]
+
+
+def test_run_suite_pooled_stages_are_single_threaded(sample_df, monkeypatch):
+    engine = DataAnalysisEngine()
+    seen = []
+
+    def record_thread_limits(df):
+        seen.append({pool["user_api"]: pool["num_threads"] for pool in threadpool_info()})
+        return {}
+
+    monkeypatch.setattr(engine, "basic_statistics", record_thread_limits)
+    monkeypatch.setattr(engine, "exploratory_analysis", record_thread_limits)
+
+    engine.run_suite(sample_df, {"basic_statistics": True, "exploratory": True}, max_workers=2)
+
+    assert len(seen) == 2
+    assert all(num_threads == 1 for limits in seen for num_threads in limits.values())
+
+
+def test_predictive_options_only_default_n_jobs_for_forests():
+    forest = DataAnalysisEngine._predictive_options({"features": ["x"], "target": "y", "model_type": "forest"}, -1)
+    hist = DataAnalysisEngine._predictive_options({"features": ["x"], "target": "y", "model_type": "hist"}, -1)
+
+    assert forest == {"n_jobs": -1}
+    assert hist == {}
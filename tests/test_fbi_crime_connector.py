@@ -0,0 +1,76 @@
+import pytest
+import requests
+
+import connectors.fbi_crime.connector as fbi_module
+from connectors.fbi_crime.connector import FBICrimeConnector
+
+
+class FakeSession:
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(fbi_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def make_connector(outcomes, **config):
+    connector = FBICrimeConnector({"api_key": "test", "max_retries": 3, **config})
+    connector.session = FakeSession(outcomes)
+    return connector
+
+
+def test_execute_with_retry_retries_after_timeout(sleeps, make_response):
+    connector = make_connector([requests.exceptions.Timeout("timed out"), make_response(200)])
+
+    response = connector._execute_with_retry("https://example.test", {})
+
+    assert response.status_code == 200
+    assert connector.session.calls == 2
+    assert sleeps == [1]
+
+
+def test_execute_with_retry_raises_http_error_on_final_rate_limit(sleeps, make_response):
+    connector = make_connector([make_response(429, headers={"Retry-After": "0"})] * 3)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        connector._execute_with_retry("https://example.test", {})
+
+    assert connector.session.calls == 3
+    assert sleeps == [0, 0]
+
+
+@pytest.mark.parametrize("retry_after", ["Wed, 21 Oct 2015 07:28:00 GMT", "nan", "inf", "1.5"])
+def test_execute_with_retry_handles_non_integer_retry_after(sleeps, make_response, retry_after):
+    connector = make_connector(
+        [make_response(429, headers={"Retry-After": retry_after}), make_response(200)],
+        retry_delay=2,
+    )
+
+    response = connector._execute_with_retry("https://example.test", {})
+
+    assert response.status_code == 200
+    assert sleeps == [2]
+
+
+def test_execute_with_retry_caps_total_wait(sleeps, make_response):
+    connector = make_connector(
+        [make_response(429, headers={"Retry-After": "20"})] * 3,
+        max_retry_seconds=30,
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        connector._execute_with_retry("https://example.test", {})
+
+    assert sleeps == [20, 10]
@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+
+from connectors.local_file.connector import LocalFileConnector
+
+
+@pytest.fixture
+def csv_connector(tmp_path):
+    path = tmp_path / "crops.csv"
+    pd.DataFrame(
+        {
+            "state": ["IA", "IL", "IA", "NE", "IA", "IL"],
+            "crop": ["corn", "corn", "soy", "corn", "corn", "soy"],
+            "yield": [180, 195, 55, 170, 210, 60],
+        }
+    ).to_csv(path, index=False)
+    return LocalFileConnector({"file_path": str(path)})
+
+
+def test_query_combines_operator_and_equality_filters(csv_connector):
+    result = csv_connector.query({
+        "filters": {
+            "yield": {"$gte": 60, "$lt": 200, "$ne": 170, "$regex": "ignored"},
+            "crop": "corn",
+            "missing_column": "ignored",
+        }
+    })
+
+    assert result["data"] == [
+        {"state": "IA", "crop": "corn", "yield": 180},
+        {"state": "IL", "crop": "corn", "yield": 195},
+    ]
+
+
+def test_query_without_filters_returns_all_rows(csv_connector):
+    result = csv_connector.query({"filters": {}})
+
+    assert len(result["data"]) == 6
@@ -53,7 +53,7 @@ class SampleQueryEngine(QueryEngine):
         return response
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_responses():
     return {
         "census_api": {
@@ -0,0 +1,66 @@
+import pytest
+import requests
+
+import connectors.usda_nass.connector as nass_module
+from connectors.usda_nass.connector import USDANASSConnector
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.urls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.urls.append(url)
+        return self._responses.pop(0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(nass_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def make_connector(responses=()):
+    connector = USDANASSConnector({"api_key": "test"})
+    connector.session = FakeSession(responses)
+    connector.connected = True
+    return connector
+
+
+def test_query_parses_body_orjson_rejects_without_retrying(sleeps, make_response):
+    # NaN is valid for response.json() but rejected by orjson
+    connector = make_connector([make_response(content=b'{"data": [{"Value": NaN}]}')])
+
+    result = connector.query({"commodity_desc": "CORN"})
+
+    assert result["metadata"]["record_count"] == 1
+    assert len(connector.session.urls) == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize("parameters", [
+    {},
+    {"commodity_desc": "CORN", "year": 2020},
+    {"short_desc": "CORN, GRAIN - YIELD, MEASURED IN BU / ACRE", "county_name": "Saint Louis & Co"},
+    {"state_alpha": ["IA", "IL"], "year__GE": 2015},
+    {"state_alpha": ["IA", None, "IL"], "county_name": None},
+    {"state_alpha": [None]},
+    {"format": "CSV", "commodity_desc": "CORN"},
+    {"key": "override", "format": None},
+    {"key": None},
+    {"key": None, "format": None},
+    {"commodity_desc": "CAFÉ"},
+])
+def test_query_url_matches_requests_encoding(sleeps, make_response, parameters):
+    connector = make_connector([make_response(payload={"data": []})])
+
+    connector.query(parameters)
+
+    expected = requests.Request(
+        "GET",
+        f"{connector.base_url}/api_GET",
+        params={"key": connector.api_key, "format": connector.format, **parameters}
+    ).prepare().url
+    assert connector.session.urls == [expected]